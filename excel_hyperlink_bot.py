@@ -1,11 +1,21 @@
 import openpyxl
 from openpyxl.styles import Font
+from openpyxl.cell import WriteOnlyCell
 import re
+import string
 import os
+import errno
 import shutil
 from datetime import datetime
 import json
+import zipfile
+import xml.etree.ElementTree as ET
 import logging
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import multiprocessing
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Try to import tqdm for progress bars, with fallback
 try:
@@ -24,6 +34,8 @@ class BotConfig:
             "backup_files": True,
             "auto_detect": True,
             "max_rows_to_process": 100000,
+            "low_memory_mode": False,
+            "batch_workers": 2,
             "supported_extensions": [".xlsx", ".xlsm", ".xltx", ".xltm"],
             "social_media_platforms": ["linkedin", "twitter", "facebook", "instagram", "youtube"],
             "log_level": "INFO"
@@ -68,23 +80,46 @@ def setup_logging():
     """Setup logging with rotation"""
     log_file = 'excel_bot.log'
     
-    # Clear log if it gets too large (>10MB)
-    if os.path.exists(log_file) and os.path.getsize(log_file) > 10 * 1024 * 1024:
-        os.remove(log_file)
+    # Roll over at 10MB while writing, keeping the last 3 logs
+    file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8')
     
+    # force=True replaces the default handler installed by logging calls made
+    # before setup (e.g. while loading the config), and lets the log level be changed
     logging.basicConfig(
         level=getattr(logging, config.get('log_level')),
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            file_handler,
             logging.StreamHandler()  # Also print to console
-        ]
+        ],
+        force=True
     )
     logging.info("=== Excel Hyperlink Bot Started ===")
 
+def init_batch_worker(log_queue):
+    """Send a batch worker's log records to the parent process
+    
+    RotatingFileHandler is not safe to share between processes (rollovers
+    clobber each other's backups, and fail on Windows while the file is
+    open elsewhere), so only the parent writes excel_bot.log.
+    """
+    # The parent's handlers do the formatting; pass the bare message through
+    logging.basicConfig(
+        level=getattr(logging, config.get('log_level')),
+        format='%(message)s',
+        handlers=[QueueHandler(log_queue)],
+        force=True
+    )
+
 # ==================== BACKUP SYSTEM ====================
 def create_backup(file_path):
-    """Create timestamped backup before conversion"""
+    """Create timestamped backup before conversion
+    
+    The backup is a hard link when possible, which costs no extra I/O. This is
+    safe because processing never writes to the original file (output goes to
+    a separate _with_hyperlinks file); editing the original in place
+    afterwards would however show up in the backup too.
+    """
     if not config.get('backup_files'):
         return None
     
@@ -92,14 +127,24 @@ def create_backup(file_path):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_dir = "backups"
         
-        # Create backups directory if it doesn't exist
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+        # Create backups directory if it doesn't exist (batch workers may race here)
+        os.makedirs(backup_dir, exist_ok=True)
         
         file_name = os.path.basename(file_path)
         backup_path = os.path.join(backup_dir, f"{file_name}.backup_{timestamp}")
         
-        shutil.copy2(file_path, backup_path)
+        try:
+            os.link(file_path, backup_path)
+        except FileExistsError:
+            # Same file processed again within the same second: a link to it
+            # is already a valid backup, anything else is overwritten as before
+            if not os.path.samefile(file_path, backup_path):
+                shutil.copy2(file_path, backup_path)
+        except OSError as e:
+            # Only a different filesystem or no link support warrants a full copy
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK):
+                raise
+            shutil.copy2(file_path, backup_path)
         logging.info(f"Backup created: {backup_path}")
         return backup_path
     
@@ -110,7 +155,9 @@ def create_backup(file_path):
 def restore_backup(backup_path, original_path):
     """Restore from backup if needed"""
     try:
-        shutil.copy2(backup_path, original_path)
+        # A hard-linked backup that still points at the original needs no copy
+        if not (os.path.exists(original_path) and os.path.samefile(backup_path, original_path)):
+            shutil.copy2(backup_path, original_path)
         logging.info(f"Restored from backup: {backup_path}")
         return True
     except Exception as e:
@@ -118,10 +165,38 @@ def restore_backup(backup_path, original_path):
         return False
 
 # ==================== CORE DETECTION FUNCTIONS ====================
+# Patterns are compiled once at import time since they run on every cell
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_WEBSITE_RE = re.compile(r'^(?:https?://)?(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:\.[a-zA-Z]{2,})?(?:/\S*)?$')
+
+# Common domain extensions, found anywhere in the text so URLs with paths,
+# ports, query strings or extra labels (news.bbc.co.uk/sport) still match
+_COMMON_DOMAINS = (
+    '.com', '.org', '.net', '.edu', '.gov', '.io', '.co', '.info', '.in',
+    '.us', '.uk', '.ca', '.au', '.de', '.fr', '.jp', '.cn', '.br', '.ru',
+    '.mx', '.es', '.it', '.nl', '.se', '.no', '.dk', '.fi', '.pl', '.ch'
+)
+_COMMON_DOMAINS_RE = re.compile('|'.join(re.escape(ext) for ext in _COMMON_DOMAINS))
+
+# LinkedIn and website detectors fused into one alternation, tried in the same
+# priority order as before in a single regex call. Like the individual
+# validators it runs on lowercased text; email stays a separate, case-sensitive
+# check (IGNORECASE would let [a-zA-Z] match characters such as 'ſ' or 'K')
+_DETECT_RE = re.compile(
+    r'(?P<linkedin>.*linkedin\.com)'
+    r'|(?P<website>https?://.*'
+    rf'|.*(?:{_COMMON_DOMAINS_RE.pattern})'
+    rf'|{_WEBSITE_RE.pattern})',
+    re.DOTALL
+)
+
 def is_valid_email(text):
     """Check if text is a valid email address"""
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(email_pattern, str(text).strip()) is not None
+    text = str(text).strip()
+    # Cheap checks first - most cells are plain text without an '@'
+    if '@' not in text or '.' not in text:
+        return False
+    return _EMAIL_RE.match(text) is not None
 
 def is_valid_website(text):
     """Check if text is a valid website URL"""
@@ -129,17 +204,15 @@ def is_valid_website(text):
     if not text or '.' not in text:
         return False
     
-    # Common domain extensions
-    common_domains = [
-        '.com', '.org', '.net', '.edu', '.gov', '.io', '.co', '.info', '.in',
-        '.us', '.uk', '.ca', '.au', '.de', '.fr', '.jp', '.cn', '.br', '.ru',
-        '.mx', '.es', '.it', '.nl', '.se', '.no', '.dk', '.fi', '.pl', '.ch'
-    ]
+    # Numbers like "3.14" can never be a domain
+    if not any(c.isalpha() for c in text):
+        return False
     
-    # Website pattern
-    website_pattern = r'^(https?://)?(www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:\.[a-zA-Z]{2,})?(?:/\S*)?$'
+    # Obvious cases don't need the regex at all
+    if _COMMON_DOMAINS_RE.search(text) or text.startswith(('http://', 'https://')):
+        return True
     
-    return (re.match(website_pattern, text) is not None) or any(ext in text for ext in common_domains)
+    return _WEBSITE_RE.match(text) is not None
 
 def is_valid_linkedin(text):
     """Check if text is a LinkedIn URL"""
@@ -160,46 +233,108 @@ def detect_content_type(text):
     if not text:
         return "empty"
     
-    if is_valid_email(text):
-        return "email"
-    elif is_valid_linkedin(text):
-        return "linkedin"
-    elif is_valid_website(text):
-        return "website"
-    else:
+    # Every linkable type contains a dot
+    if '.' not in text:
         return "text"
-
-def analyze_column(ws, column_letter):
-    """Analyze a column to detect what type of content it contains"""
-    content_types = {}
-    sample_size = min(100, ws.max_row)
     
-    for row in range(1, sample_size + 1):
-        cell = ws[f'{column_letter}{row}']
-        value = str(cell.value).strip() if cell.value else ""
-        
-        if value:
-            content_type = detect_content_type(value)
-            content_types[content_type] = content_types.get(content_type, 0) + 1
+    if '@' in text and _EMAIL_RE.match(text):
+        return "email"
     
+    match = _DETECT_RE.match(text.lower())
+    return match.lastgroup if match else "text"
+
+@lru_cache(maxsize=65536)
+def cached_content_type(value):
+    """Memoized detect_content_type for repeated cell values (blanks, shared domains, ...)"""
+    return detect_content_type(value)
+
+def summarize_content_types(content_types):
+    """Return the dominant content type and its count from a Counter"""
     if content_types:
-        return max(content_types.items(), key=lambda x: x[1])
+        return content_types.most_common(1)[0]
     return ("unknown", 0)
 
+# ==================== COLUMN SPECIALIZATION ====================
+# Share of the sampled cells the dominant type needs before a column
+# switches to its specialized classifier
+SPECIALIZE_THRESHOLD = 0.9
+
+@lru_cache(maxsize=65536)
+def classify_email_column(value):
+    """Classifier for columns that are almost all emails
+    
+    Only the email check runs for the common case; anything else goes through
+    full detection so mixed cells are still linked correctly. Memoized like
+    cached_content_type, since dominant-type columns repeat values the most.
+    """
+    if is_valid_email(value):
+        return "email"
+    return cached_content_type(value)
+
+@lru_cache(maxsize=65536)
+def classify_website_column(value):
+    """Classifier for columns that are almost all websites or LinkedIn URLs
+    
+    Without an '@' a valid website can only be detected as website or
+    LinkedIn, and both get the same kind of hyperlink.
+    """
+    if '@' not in value and is_valid_website(value):
+        return "linkedin" if is_valid_linkedin(value) else "website"
+    return cached_content_type(value)
+
+COLUMN_CLASSIFIERS = {
+    "email": classify_email_column,
+    "website": classify_website_column,
+    "linkedin": classify_website_column,
+}
+
 # ==================== PROGRESS-BASED CONVERSION ====================
-def convert_column_to_hyperlinks(ws, column_letter, column_name):
-    """Convert a specific column to hyperlinks with progress tracking"""
-    hyperlink_font = Font(color=config.get('hyperlink_color'), underline='single')
-    converted_count = 0
+# Rows processed between progress bar refreshes
+PROGRESS_UPDATE_ROWS = 1000
+
+@lru_cache(maxsize=None)
+def get_hyperlink_font(color):
+    """Return the shared hyperlink font for a color, created on first use
+    
+    Keyed on the color so a change made in the configuration menu simply
+    builds a new font instead of reusing a stale one.
+    """
+    return Font(color=color, underline='single')
+
+def apply_hyperlink(cell, value, content_type, hyperlink_font):
+    """Set hyperlink and font on a cell based on its content type"""
+    if content_type == "email":
+        cell.hyperlink = f'mailto:{value}'
+    elif content_type in ["website", "linkedin"]:
+        cell.hyperlink = format_website_url(value)
+    else:
+        return False
     
-    # Analyze column content
-    content_type, confidence = analyze_column(ws, column_letter)
-    print(f"📊 Column {column_letter} ({column_name}): {content_type} (confidence: {confidence})")
+    cell.font = hyperlink_font
+    return True
+
+def convert_column_to_hyperlinks(ws, col_idx, column_name, verbose=True):
+    """Convert a specific column to hyperlinks with progress tracking
+    
+    With verbose=False nothing is printed (used by batch workers).
+    """
+    column_letter = openpyxl.utils.get_column_letter(col_idx)
+    hyperlink_font = get_hyperlink_font(config.get('hyperlink_color'))
+    converted_count = 0
     
     total_rows = min(ws.max_row, config.get('max_rows_to_process'))
     
+    # Column content is analyzed on the first rows of the same pass that
+    # converts them (skipped entirely when auto-detect is off)
+    auto_detect = config.get('auto_detect')
+    sample_size = min(100, total_rows)
+    sample_counter = Counter()
+    classify = cached_content_type
+    
     # Use progress bar if available
-    if TQDM_AVAILABLE:
+    show_bar = verbose and TQDM_AVAILABLE
+    if show_bar:
+        pending_rows = 0
         progress_bar = tqdm(
             total=total_rows, 
             desc=f"🔄 {column_letter}", 
@@ -207,44 +342,239 @@ def convert_column_to_hyperlinks(ws, column_letter, column_name):
             bar_format='{l_bar}{bar:30}{r_bar}',
             ncols=80
         )
-    else:
+    elif verbose:
         print(f"⏳ Processing {column_letter} ({total_rows} rows)...")
         last_progress = 0
     
-    for row in range(1, total_rows + 1):
-        cell = ws[f'{column_letter}{row}']
-        value = str(cell.value).strip() if cell.value else ""
+    # Walk the column's cells directly instead of parsing "A1"-style coordinates per row
+    column_cells = next(ws.iter_cols(min_col=col_idx, max_col=col_idx, min_row=1, max_row=total_rows), ())
+    
+    for row, cell in enumerate(column_cells, start=1):
+        # Numbers, dates etc. can never be links, so only strings are examined
+        value = cell.value.strip() if isinstance(cell.value, str) else ""
         
         if value:
-            content_type = detect_content_type(value)
+            content_type = classify(value)
             
-            if content_type == "email":
-                cell.hyperlink = f'mailto:{value}'
-                cell.font = hyperlink_font
-                converted_count += 1
-                
-            elif content_type in ["website", "linkedin"]:
-                formatted_url = format_website_url(value)
-                cell.hyperlink = formatted_url
-                cell.font = hyperlink_font
+            if auto_detect and row <= sample_size:
+                sample_counter[content_type] += 1
+            
+            if apply_hyperlink(cell, value, content_type, hyperlink_font):
                 converted_count += 1
         
-        # Update progress
-        if TQDM_AVAILABLE:
-            progress_bar.update(1)
-        else:
+        if auto_detect and row == sample_size:
+            dominant_type, confidence = summarize_content_types(sample_counter)
+            message = f"📊 Column {column_letter} ({column_name}): {dominant_type} (confidence: {confidence})"
+            if show_bar:
+                progress_bar.write(message)
+            elif verbose:
+                print(message)
+            
+            # Specialize the rest of the column on its dominant content type
+            if confidence > SPECIALIZE_THRESHOLD * sum(sample_counter.values()):
+                classify = COLUMN_CLASSIFIERS.get(dominant_type, classify)
+        
+        # Update progress (tqdm in batches, per-row calls dominate on long columns)
+        if show_bar:
+            pending_rows += 1
+            if pending_rows == PROGRESS_UPDATE_ROWS:
+                progress_bar.update(pending_rows)
+                pending_rows = 0
+        elif verbose:
             # Simple progress indicator without tqdm
             progress = (row * 100) // total_rows
             if progress >= last_progress + 10:  # Update every 10%
                 print(f"   {progress}% complete ({row}/{total_rows} rows)")
                 last_progress = progress
     
-    if TQDM_AVAILABLE:
+    if show_bar:
+        progress_bar.update(pending_rows)
         progress_bar.close()
     
     return converted_count
 
+# ==================== LOW MEMORY CONVERSION ====================
+MACRO_EXTENSIONS = ('.xlsm', '.xltm')
+
+def stream_convert_workbook(file_path, output_path, verbose=True):
+    """Convert the active sheet by streaming rows instead of loading the whole workbook
+    
+    The input is opened read-only and rows are appended to a write-only
+    workbook, so memory stays flat on very large files. Only cell values of
+    the active sheet are carried over (no formatting, formulas or other sheets).
+    Macro-enabled files are refused since the streamed copy can't keep macros.
+    """
+    if file_path.lower().endswith(MACRO_EXTENSIONS):
+        raise ValueError("Low memory mode can't keep macros; turn it off to process .xlsm/.xltm files")
+    
+    hyperlink_font = get_hyperlink_font(config.get('hyperlink_color'))
+    max_rows = config.get('max_rows_to_process')
+    converted_count = 0
+    
+    wb_in = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws_in = wb_in.active
+        wb_out = openpyxl.Workbook(write_only=True)
+        # Templates need the template content type or Excel refuses to open them
+        wb_out.template = file_path.lower().endswith('.xltx')
+        ws_out = wb_out.create_sheet(ws_in.title)
+        
+        # Make it obvious what the streamed copy leaves behind
+        warning = "Low memory mode copies only cell values of the active sheet; formatting and formulas are not kept"
+        other_sheets = [name for name in wb_in.sheetnames if name != ws_in.title]
+        if other_sheets:
+            warning += f", and these sheets are left out: {', '.join(other_sheets)}"
+        logging.warning(f"{file_path}: {warning}")
+        if verbose:
+            print(f"⚠️  {warning}")
+            print(f"⏳ Streaming {ws_in.title} (low memory mode)...")
+        
+        for row, values in enumerate(ws_in.iter_rows(values_only=True), start=1):
+            row_cells = []
+            for col, v in enumerate(values, start=1):
+                cell = WriteOnlyCell(ws_out, value=v)
+                value = v.strip() if isinstance(v, str) else ""
+                
+                if value and row <= max_rows:
+                    # Hyperlink ref is taken from the cell position when assigned
+                    cell.row, cell.column = row, col
+                    if apply_hyperlink(cell, value, cached_content_type(value), hyperlink_font):
+                        converted_count += 1
+                
+                row_cells.append(cell)
+            ws_out.append(row_cells)
+    finally:
+        wb_in.close()
+    
+    wb_out.save(output_path)
+    return converted_count
+
+# ==================== QUICK CONTENT PREVIEW ====================
+SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+def active_sheet_path(archive):
+    """Return the zip member name of the workbook's active sheet"""
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    view = workbook.find(f'{SPREADSHEET_NS}bookViews/{SPREADSHEET_NS}workbookView')
+    active_tab = int(view.get('activeTab', 0)) if view is not None else 0
+    sheet = workbook.findall(f'{SPREADSHEET_NS}sheets/{SPREADSHEET_NS}sheet')[active_tab]
+    
+    rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iter(f'{PACKAGE_REL_NS}Relationship'):
+        if rel.get('Id') == sheet.get(f'{RELATIONSHIP_NS}id'):
+            target = rel.get('Target')
+            # Targets are relative to xl/ unless given as an absolute package path
+            return target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+    raise KeyError(f"No relationship for sheet {sheet.get('name')}")
+
+def fast_sample_strings(file_path, max_rows=100):
+    """Read the text cells of the active sheet's first rows straight from the workbook XML
+    
+    Streams the sheet (and only the shared strings it refers to) out of the
+    zip without building any openpyxl objects, so it is cheap even for very
+    large files. Returns {column_letter: [text, ...]}, empty if nothing can
+    be read.
+    """
+    cells = []  # (column_letter, text or shared string index)
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open(active_sheet_path(archive)) as xml_file:
+                for _, elem in ET.iterparse(xml_file):
+                    if elem.tag == f'{SPREADSHEET_NS}c' and elem.get('r'):
+                        column_letter = openpyxl.utils.cell.coordinate_from_string(elem.get('r'))[0]
+                        cell_type = elem.get('t')
+                        value = elem.find(f'{SPREADSHEET_NS}v')
+                        if cell_type == 's' and value is not None:
+                            cells.append((column_letter, int(value.text)))
+                        elif cell_type == 'inlineStr':
+                            # Rich text splits a string over several <t> runs
+                            cells.append((column_letter, ''.join(elem.itertext())))
+                        elif cell_type == 'str' and value is not None:
+                            cells.append((column_letter, value.text or ''))
+                    elif elem.tag == f'{SPREADSHEET_NS}row':
+                        row_number = int(elem.get('r', 0))
+                        elem.clear()
+                        if row_number >= max_rows:
+                            break
+            
+            # Resolve shared string indices, stopping once all of them are found
+            wanted = {text for _, text in cells if isinstance(text, int)}
+            shared = {}
+            if wanted:
+                with archive.open('xl/sharedStrings.xml') as xml_file:
+                    index = 0
+                    for _, elem in ET.iterparse(xml_file):
+                        if elem.tag == f'{SPREADSHEET_NS}si':
+                            if index in wanted:
+                                shared[index] = ''.join(elem.itertext())
+                                if len(shared) == len(wanted):
+                                    break
+                            index += 1
+                            elem.clear()
+    except (KeyError, IndexError, ValueError, zipfile.BadZipFile, ET.ParseError) as e:
+        logging.debug(f"No strings sampled from {file_path}: {e}")
+        return {}
+    
+    columns = {}
+    for column_letter, text in cells:
+        columns.setdefault(column_letter, []).append(shared.get(text, '') if isinstance(text, int) else text)
+    return columns
+
+def estimate_content_types(file_path, max_rows=100):
+    """Estimate each column's content types from the active sheet's first rows"""
+    return {
+        column_letter: Counter(cached_content_type(text.strip()) for text in texts if text.strip())
+        for column_letter, texts in fast_sample_strings(file_path, max_rows).items()
+    }
+
+def preview_file(file_path):
+    """Analyze-only mode: show each column's detected content without converting"""
+    column_types = estimate_content_types(file_path)
+    if not column_types:
+        print("❌ No text found to analyze in the active sheet")
+        return
+    
+    print(f"\n🔎 Preview of {os.path.basename(file_path)} (first 100 rows of the active sheet):")
+    for column_letter in sorted(column_types, key=openpyxl.utils.column_index_from_string):
+        content_type, confidence = summarize_content_types(column_types[column_letter])
+        print(f"📊 Column {column_letter}: {content_type} (confidence: {confidence})")
+    logging.info(f"Previewed {file_path}")
+
 # ==================== BATCH PROCESSING ====================
+def iter_batch_results(excel_files, workers):
+    """Convert files quietly, yielding (file_path, summary, error) as each one finishes
+    
+    Files are independent, so they are spread over a process pool; with a
+    single worker they are simply converted in this process.
+    """
+    if workers <= 1:
+        for file_path in excel_files:
+            try:
+                yield file_path, convert_file(file_path, verbose=False), None
+            except Exception as e:
+                yield file_path, None, e
+        return
+    
+    # Worker log records come back over a queue and are written to the log
+    # file by this process only (not echoed to the console)
+    log_queue = multiprocessing.Queue()
+    file_handlers = [h for h in logging.getLogger().handlers if isinstance(h, RotatingFileHandler)]
+    listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+    listener.start()
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker, initargs=(log_queue,)) as executor:
+            futures = {executor.submit(convert_file, file_path, False): file_path for file_path in excel_files}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], None, e
+    finally:
+        listener.stop()
+
 def batch_process_folder(folder_path):
     """Process all Excel files in a folder"""
     if not os.path.exists(folder_path):
@@ -252,37 +582,48 @@ def batch_process_folder(folder_path):
         print("❌ Folder not found!")
         return False
     
-    excel_files = []
-    for file in os.listdir(folder_path):
-        if any(file.lower().endswith(ext) for ext in config.get('supported_extensions')):
-            excel_files.append(os.path.join(folder_path, file))
+    # Look the extensions up once; str.endswith takes the whole tuple in one call
+    extensions = tuple(config.get('supported_extensions'))
+    
+    # scandir entries carry their name, path and file type without extra stat calls
+    with os.scandir(folder_path) as entries:
+        excel_files = [entry.path for entry in entries
+                       if entry.is_file() and entry.name.lower().endswith(extensions)]
     
     if not excel_files:
         logging.warning(f"No Excel files found in: {folder_path}")
         print("❌ No Excel files found in the folder!")
         return False
     
-    print(f"📁 Found {len(excel_files)} Excel files to process")
-    logging.info(f"Found {len(excel_files)} Excel files to process")
+    # Every worker holds a whole workbook in memory, so keep the pool small
+    workers = max(1, min(config.get('batch_workers'), os.cpu_count() or 1, len(excel_files)))
+    
+    print(f"📁 Found {len(excel_files)} Excel files to process ({workers} worker(s))")
+    logging.info(f"Found {len(excel_files)} Excel files to process with {workers} worker(s)")
+    if config.get('low_memory_mode'):
+        print("⚠️  Low memory mode: outputs will contain only the active sheet's values (no formatting, formulas or other sheets); .xlsm/.xltm files are refused")
     
     success_count = 0
+    results = iter_batch_results(excel_files, workers)
     
     # Use progress bar for batch processing if available
     if TQDM_AVAILABLE:
-        batch_progress = tqdm(excel_files, desc="Processing folder", leave=True)
+        batch_progress = tqdm(results, total=len(excel_files), desc="Processing folder", leave=True)
+        report = batch_progress.write
     else:
-        batch_progress = excel_files
+        batch_progress = results
+        report = print
         print("🔄 Starting batch processing...")
     
-    for i, file_path in enumerate(batch_progress):
-        try:
-            if process_single_file(file_path):
-                success_count += 1
-            else:
-                logging.error(f"Failed to process: {file_path}")
-        except Exception as e:
-            logging.error(f"Error processing {file_path}: {e}")
-            print(f"❌ Error processing {os.path.basename(file_path)}: {e}")
+    # Workers run quietly; per-file results are reported here so output stays readable
+    for i, (file_path, summary, error) in enumerate(batch_progress):
+        file_name = os.path.basename(file_path)
+        if error is None:
+            success_count += 1
+            report(f"✅ {file_name}: {summary['converted']} hyperlinks → {summary['output_path']}")
+        else:
+            logging.error(f"Error processing {file_path}: {error}")
+            report(f"❌ Error processing {file_name}: {error}")
         
         # Update progress for non-tqdm
         if not TQDM_AVAILABLE:
@@ -297,20 +638,33 @@ def batch_process_folder(folder_path):
     return success_count > 0
 
 # ==================== SINGLE FILE PROCESSING ====================
-def process_single_file(file_path):
-    """Process a single Excel file with all features"""
-    try:
-        logging.info(f"Starting processing: {file_path}")
-        
-        # Create backup
-        backup_path = create_backup(file_path)
-        
+def convert_file(file_path, verbose=True):
+    """Back up and convert one Excel file, returning a summary dict
+    
+    The summary holds output_path, converted and backup_path. Errors are
+    raised to the caller. With verbose=False nothing is printed, which is how
+    batch workers run.
+    """
+    logging.info(f"Starting processing: {file_path}")
+    
+    # Create backup
+    backup_path = create_backup(file_path)
+    
+    base_name, ext = os.path.splitext(file_path)
+    output_path = f"{base_name}_with_hyperlinks{ext}"
+    
+    if verbose:
+        print(f"\n📁 Processing: {os.path.basename(file_path)}")
+    
+    if config.get('low_memory_mode'):
+        total_converted = stream_convert_workbook(file_path, output_path, verbose)
+    else:
         # Load workbook
         wb = openpyxl.load_workbook(file_path)
         ws = wb.active
         
-        print(f"\n📁 Processing: {os.path.basename(file_path)}")
-        print(f"📏 Dimensions: {ws.max_row} rows × {ws.max_column} columns")
+        if verbose:
+            print(f"📏 Dimensions: {ws.max_row} rows × {ws.max_column} columns")
         
         total_converted = 0
         
@@ -320,20 +674,25 @@ def process_single_file(file_path):
             header = ws.cell(row=1, column=col).value
             column_name = header if header else f"Column {column_letter}"
             
-            converted = convert_column_to_hyperlinks(ws, column_letter, column_name)
+            converted = convert_column_to_hyperlinks(ws, col, column_name, verbose)
             total_converted += converted
         
         # Save the workbook
-        base_name, ext = os.path.splitext(file_path)
-        output_path = f"{base_name}_with_hyperlinks{ext}"
         wb.save(output_path)
+    
+    logging.info(f"Conversion completed: {total_converted} links converted")
+    return {"output_path": output_path, "converted": total_converted, "backup_path": backup_path}
+
+def process_single_file(file_path):
+    """Process a single Excel file with all features"""
+    try:
+        summary = convert_file(file_path)
         
-        logging.info(f"Conversion completed: {total_converted} links converted")
         print(f"\n✅ Conversion completed!")
-        print(f"🔗 Total hyperlinks created: {total_converted}")
-        print(f"💾 Saved as: {output_path}")
-        if backup_path:
-            print(f"📂 Backup: {backup_path}")
+        print(f"🔗 Total hyperlinks created: {summary['converted']}")
+        print(f"💾 Saved as: {summary['output_path']}")
+        if summary['backup_path']:
+            print(f"📂 Backup: {summary['backup_path']}")
         
         return True
         
@@ -360,15 +719,17 @@ def update_configuration():
         print("\n📝 Update Configuration:")
         print("1. Change hyperlink color (current: {})".format(config.get('hyperlink_color')))
         print("2. Toggle backup files (current: {})".format(config.get('backup_files')))
-        print("3. Set max rows to process (current: {})".format(config.get('max_rows_to_process')))
-        print("4. Change log level (current: {})".format(config.get('log_level')))
-        print("5. Back to main menu")
+        print("3. Toggle low memory mode (current: {})".format(config.get('low_memory_mode')))
+        print("4. Set max rows to process (current: {})".format(config.get('max_rows_to_process')))
+        print("5. Set batch worker processes (current: {})".format(config.get('batch_workers')))
+        print("6. Change log level (current: {})".format(config.get('log_level')))
+        print("7. Back to main menu")
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-7): ").strip()
         
         if choice == "1":
             new_color = input("Enter hex color (e.g., 0000FF for blue): ").strip()
-            if re.match(r'^[0-9A-Fa-f]{6}$', new_color):
+            if len(new_color) == 6 and all(c in string.hexdigits for c in new_color):
                 config.set("hyperlink_color", new_color.upper())
                 print("✅ Color updated!")
             else:
@@ -381,6 +742,14 @@ def update_configuration():
             print(f"✅ Backup files: {new_value}")
         
         elif choice == "3":
+            new_value = not config.get("low_memory_mode")
+            config.set("low_memory_mode", new_value)
+            print(f"✅ Low memory mode: {new_value}")
+            if new_value:
+                print("⚠️  Output will contain only the active sheet's values (no formatting, formulas or other sheets)")
+                print("⚠️  Macro-enabled files (.xlsm, .xltm) are refused in this mode")
+        
+        elif choice == "4":
             try:
                 max_rows = int(input("Enter max rows to process: ").strip())
                 if max_rows > 0:
@@ -391,7 +760,18 @@ def update_configuration():
             except ValueError:
                 print("❌ Please enter a valid number")
         
-        elif choice == "4":
+        elif choice == "5":
+            try:
+                workers = int(input(f"Enter number of worker processes (1-{os.cpu_count() or 1}): ").strip())
+                if workers > 0:
+                    config.set("batch_workers", workers)
+                    print("✅ Batch workers updated!")
+                else:
+                    print("❌ Please enter a positive number")
+            except ValueError:
+                print("❌ Please enter a valid number")
+        
+        elif choice == "6":
             levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
             print("Available levels: " + ", ".join(levels))
             new_level = input("Enter log level: ").strip().upper()
@@ -402,7 +782,7 @@ def update_configuration():
             else:
                 print("❌ Invalid log level")
         
-        elif choice == "5":
+        elif choice == "7":
             break
         
         else:
@@ -442,17 +822,20 @@ def main():
         print("3. View configuration")
         print("4. Update configuration")
         print("5. View log file")
-        print("6. Exit")
+        print("6. Preview Excel file (analyze only)")
+        print("7. Exit")
         
-        choice = input("\nEnter your choice (1-6): ").strip()
+        choice = input("\nEnter your choice (1-7): ").strip()
         
-        if choice == "1":
+        if choice in ("1", "6"):
             file_path = input("Enter the path to your Excel file: ").strip()
             if os.path.exists(file_path):
-                if any(file_path.lower().endswith(ext) for ext in config.get('supported_extensions')):
+                if not file_path.lower().endswith(tuple(config.get('supported_extensions'))):
+                    print("❌ Please provide an Excel file (.xlsx, .xlsm, .xltx, .xltm)")
+                elif choice == "1":
                     process_single_file(file_path)
                 else:
-                    print("❌ Please provide an Excel file (.xlsx, .xlsm, .xltx, .xltm)")
+                    preview_file(file_path)
             else:
                 print("❌ File not found!")
         
@@ -469,7 +852,7 @@ def main():
         elif choice == "5":
             view_log_file()
         
-        elif choice == "6":
+        elif choice == "7":
             logging.info("=== Excel Hyperlink Bot Stopped ===")
             print("👋 Thank you for using the Enhanced Excel Bot!")
             break